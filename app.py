@@ -2,37 +2,54 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from pathlib import Path
-from typing import Dict, Optional
-
-from fastapi import FastAPI, File, HTTPException, Request, UploadFile, WebSocket
-from fastapi.exceptions import WebSocketDisconnect
-from fastapi.responses import HTMLResponse, StreamingResponse
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import orjson
+from fastapi import APIRouter, Depends, FastAPI, File, HTTPException, Request, UploadFile, WebSocket
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError, WebSocketDisconnect
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from jinja2 import FileSystemBytecodeCache
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+try:
+    import msgpack
+except Exception:  # pragma: no cover - optional dependency import guard
+    msgpack = None  # type: ignore
 
-from core.db import init_db
+from core.db import init_db_async
 from domains.chat.router import router as chat_router
+from domains.chat.writer import message_writer
 from domains.models.router import router as models_router
 from forge.ai_controller import ai_controller
 from forge.build_stream import build_stream
 from forge.local_ai import local_ai
-from forge.model_lab import SUPPORTED_EXTENSIONS, model_lab
+from forge.model_lab import SUPPORTED_EXTENSIONS, UPLOAD_CHUNK_SIZE, model_lab
 from forge.project_manager import project_manager
-from forge.utils import MODELS_DIR, PROJECTS_DIR, get_active_model, set_active_model
+from forge.utils import DATA_DIR, MODELS_DIR, PROJECTS_DIR, get_active_model, set_active_model
+
+TEMPLATE_CACHE_DIR = DATA_DIR / ".jinja-cache"
+MAX_CONCURRENT_BUILDS = int(os.getenv("MAX_CONCURRENT_BUILDS", "4"))
+_SUPPORTED_SUFFIXES = frozenset(extension.lstrip(".").lower() for extension in SUPPORTED_EXTENSIONS)
 
 
 class BuildRequest(BaseModel):
     """Payload schema for initiating a build session."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     message: str
 
 
 class ProjectCreationRequest(BaseModel):
     """Schema for manual project creation requests."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     files: Dict[str, str]
     summary: Optional[str] = None
@@ -41,83 +58,122 @@ class ProjectCreationRequest(BaseModel):
 class ProjectFilePayload(BaseModel):
     """Schema for saving a single project file."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     content: str
 
 
 class ModelCompareRequest(BaseModel):
     """Schema for comparing two stored models."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     first: str
     second: str
 
 
-app = FastAPI(title="AI-WebForge", description="Private AI-assisted web scaffold generator.")
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+_build_request_adapter = TypeAdapter(BuildRequest)
+
+
+_build_slots = asyncio.Semaphore(MAX_CONCURRENT_BUILDS)
+_build_tasks: Set["asyncio.Task[None]"] = set()
+
+
+async def _run_build_guarded(session_id: str) -> None:
+    """Run a build once one of the limited build slots is free."""
+
+    async with _build_slots:
+        await ai_controller.run_build(session_id)
+
+
+async def _parse_build_request(request: Request) -> BuildRequest:
+    """Validate the build payload directly from the raw JSON body."""
+
+    try:
+        return _build_request_adapter.validate_json(await request.body())
+    except ValidationError as exc:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        raise RequestValidationError(errors) from exc
 
 
-@app.on_event("startup")
-def _startup() -> None:
-    init_db()
+async def _iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in ``UPLOAD_CHUNK_SIZE`` pieces without buffering it whole."""
 
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
 
-app.include_router(chat_router)
-app.include_router(models_router)
 
+def _require_project(project: str) -> None:
+    """Raise a 404 up front when ``project`` is not a stored project."""
 
-@app.get("/", response_class=HTMLResponse)
+    if not project_manager.exists(project):
+        raise HTTPException(status_code=404, detail=f"Project '{project}' not found.")
+
+
+TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+templates = Jinja2Templates(directory="templates")
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR))
+# template edits are only picked up on restart unless explicitly requested
+templates.env.auto_reload = bool(os.getenv("WEBFORGE_TEMPLATE_RELOAD"))
+router = APIRouter()
+build_router = APIRouter()
+
+
+@router.get("/", response_class=HTMLResponse)
 async def read_root(request: Request) -> HTMLResponse:
-    """Render the chat dashboard."""
-    projects = project_manager.list_projects()
-    return templates.TemplateResponse(
-        "index.html",
-        {"request": request, "projects": projects},
-    )
+    """Render the chat dashboard shell; data is loaded from ``/api/bootstrap``."""
+    return templates.TemplateResponse("index.html", {"request": request})
 
 
-@app.get("/projects", response_class=HTMLResponse)
+@router.get("/projects", response_class=HTMLResponse)
 async def projects_page(request: Request) -> HTMLResponse:
     """Render the projects dashboard."""
-    projects = project_manager.list_projects()
+    projects = await run_in_threadpool(project_manager.list_projects)
     return templates.TemplateResponse("projects.html", {"request": request, "projects": projects})
 
 
-@app.get("/models", response_class=HTMLResponse)
+@router.get("/models", response_class=HTMLResponse)
 async def models_page(request: Request) -> HTMLResponse:
     """Render the model management dashboard."""
-    models = model_lab.list_models()
+    models = await run_in_threadpool(model_lab.list_models)
     active = get_active_model()
     return templates.TemplateResponse("models.html", {"request": request, "models": models, "active_model": active})
 
 
-@app.get("/editor", response_class=HTMLResponse)
+@router.get("/editor", response_class=HTMLResponse)
 async def editor_landing(request: Request) -> HTMLResponse:
     """Display available projects for selection."""
 
-    projects = project_manager.list_projects()
+    projects = await run_in_threadpool(project_manager.list_projects)
     return templates.TemplateResponse("editor_select.html", {"request": request, "projects": projects})
 
 
-@app.get("/editor/{project}", response_class=HTMLResponse)
+@router.get("/editor/{project}", response_class=HTMLResponse)
 async def editor_page(request: Request, project: str) -> HTMLResponse:
     """Render the code editor for the selected project."""
-    try:
-        tree = project_manager.describe_project_tree(project)
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    _require_project(project)
+    tree_json = await run_in_threadpool(project_manager.describe_project_tree_json, project)
 
     return templates.TemplateResponse(
         "editor.html",
         {
             "request": request,
             "project": project,
-            "tree": json.dumps(tree),
+            "tree_json": tree_json,
         },
     )
 
 
-@app.post("/api/build")
-async def api_build(payload: BuildRequest) -> Dict[str, object]:
+@build_router.post(
+    "/api/build",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": BuildRequest.model_json_schema()}},
+        }
+    },
+)
+async def api_build(payload: BuildRequest = Depends(_parse_build_request)) -> Dict[str, object]:
     """Create a new build session and start streaming events."""
 
     prompt = payload.message.strip()
@@ -134,156 +190,190 @@ async def api_build(payload: BuildRequest) -> Dict[str, object]:
             "prompt": prompt,
         },
     )
-    asyncio.create_task(ai_controller.run_build(session.id))
+    task = asyncio.create_task(_run_build_guarded(session.id))
+    _build_tasks.add(task)
+    task.add_done_callback(_build_tasks.discard)
 
     return {"session": session.snapshot()}
 
 
-@app.websocket("/ws/build/{session_id}")
+async def _send_json(websocket: WebSocket, payload: Any) -> None:
+    """Send ``payload`` as a text frame encoded once with orjson."""
+
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+async def _send_msgpack(websocket: WebSocket, payload: Any) -> None:
+    """Send ``payload`` as a binary msgpack frame."""
+
+    await websocket.send_bytes(msgpack.packb(payload, use_bin_type=True))
+
+
+@build_router.websocket("/ws/build/{session_id}")
 async def ws_build(websocket: WebSocket, session_id: str) -> None:
-    """Stream build events to the connected client."""
+    """Stream build events to the connected client.
+
+    Frames are JSON text by default; clients that pass ``?format=msgpack``
+    receive the same payloads as binary msgpack frames instead.
+    """
 
     session = build_stream.get_session(session_id)
     if session is None:
         await websocket.close(code=4404)
         return
 
+    if websocket.query_params.get("format", "json") == "msgpack":
+        if msgpack is None:
+            await websocket.close(code=1003)
+            return
+        send = _send_msgpack
+    else:
+        send = _send_json
+
     await websocket.accept()
 
-    # replay existing history first
-    for event in session.history:
-        await websocket.send_json(event)
+    # snapshot the history and discard the queued copies of those same events with
+    # no await in between, so nothing published meanwhile can fall between the two
+    history = list(session.history)
+    session.drain()
 
-    while True:
-        try:
-            session.queue.get_nowait()
-        except asyncio.QueueEmpty:
-            break
+    # replay existing history first
+    if history:
+        await send(websocket, {"type": "history", "events": history})
+    if any(event.get("type") in {"complete", "error"} for event in history):
+        # the build already finished; the queue will never see another event
+        return
 
     try:
-        async for event in build_stream.stream(session_id):
-            await websocket.send_json(event)
+        async for batch in build_stream.stream_batches(session_id):
+            await send(websocket, {"type": "batch", "events": batch})
     except WebSocketDisconnect:
         return
 
 
-@app.get("/api/projects")
+@router.get("/api/bootstrap")
+async def api_bootstrap() -> Dict[str, object]:
+    """Return the initial data needed by the dashboard."""
+
+    projects = await run_in_threadpool(project_manager.list_projects)
+    models = await run_in_threadpool(model_lab.list_models)
+    return {"projects": projects, "models": models, "active": get_active_model()}
+
+
+@router.get("/api/projects")
 async def api_list_projects() -> Dict[str, object]:
     """Return metadata about all projects."""
-    return {"projects": project_manager.list_projects()}
+    return {"projects": await run_in_threadpool(project_manager.list_projects)}
 
 
-@app.post("/api/projects")
+@router.post("/api/projects")
 async def api_create_project(request: ProjectCreationRequest) -> Dict[str, object]:
     """Create a new project from the provided file mapping."""
     try:
-        project_manager.create_project(request.name, request.files, summary=request.summary or "")
+        await run_in_threadpool(
+            project_manager.create_project, request.name, request.files, summary=request.summary or ""
+        )
     except FileExistsError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     return {"status": "created"}
 
 
-@app.delete("/api/projects/{project}")
+@router.delete("/api/projects/{project}")
 async def api_delete_project(project: str) -> Dict[str, str]:
     """Delete a stored project."""
-    try:
-        project_manager.delete_project(project)
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    _require_project(project)
+    await run_in_threadpool(project_manager.delete_project, project)
     return {"status": "deleted"}
 
 
-@app.get("/api/projects/{project}/files")
+@router.get("/api/projects/{project}/files")
 async def api_project_files(project: str) -> Dict[str, object]:
     """List files belonging to a project."""
-    try:
-        files = project_manager.list_project_files(project)
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    _require_project(project)
+    files = await run_in_threadpool(project_manager.list_project_files, project)
     return {"files": files}
 
 
-@app.get("/api/projects/{project}/file")
+@router.get("/api/projects/{project}/file")
 async def api_project_file(project: str, path: str) -> Dict[str, str]:
     """Return file content for a project file."""
+    _require_project(project)
     try:
-        content = project_manager.read_file(project, path)
+        content = await run_in_threadpool(project_manager.read_file, project, path)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return {"path": path, "content": content}
 
 
-@app.post("/api/projects/save/{project}/{file_path:path}")
+@router.post("/api/projects/save/{project}/{file_path:path}")
 async def api_save_project_file(project: str, file_path: str, payload: ProjectFilePayload) -> Dict[str, str]:
     """Persist a file update to disk."""
 
-    try:
-        project_manager.save_file(project, file_path, payload.content)
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    _require_project(project)
+    await run_in_threadpool(project_manager.save_file, project, file_path, payload.content)
     return {"status": "saved"}
 
 
-@app.get("/api/projects/{project}/manifest")
+@router.get("/api/projects/{project}/manifest")
 async def api_project_manifest(project: str) -> Dict[str, object]:
     """Return manifest metadata and history for a project."""
 
-    manifest = project_manager.load_manifest(project)
+    manifest = await run_in_threadpool(project_manager.load_manifest, project)
     if not manifest:
         raise HTTPException(status_code=404, detail="Manifest not found")
     return {"manifest": manifest}
 
 
-@app.get("/api/projects/download/{project}")
+@router.get("/api/projects/download/{project}")
 async def api_download_project(project: str) -> StreamingResponse:
     """Return a zip archive for the specified project."""
-    try:
-        memory_file, filename = project_manager.zip_project(project)
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    _require_project(project)
+    archive, filename = await run_in_threadpool(project_manager.zip_project, project)
 
     headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return StreamingResponse(memory_file, media_type="application/zip", headers=headers)
+    return StreamingResponse(archive, media_type="application/zip", headers=headers)
 
 
-@app.get("/api/projects/run/{project}", response_class=HTMLResponse)
+@router.get("/api/projects/run/{project}", response_class=HTMLResponse)
 async def api_run_project(project: str) -> HTMLResponse:
     """Return HTML markup to preview a generated project."""
 
+    _require_project(project)
     try:
-        html = project_manager.preview_html(project)
+        html = await run_in_threadpool(project_manager.preview_html, project)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return HTMLResponse(html)
 
 
-@app.post("/api/models/upload")
+@router.post("/api/models/upload")
 async def api_upload_model(file: UploadFile = File(...)) -> Dict[str, object]:
     """Upload a model file into local storage."""
-    extension = Path(file.filename).suffix.lower()
-    if extension not in SUPPORTED_EXTENSIONS:
-        raise HTTPException(status_code=400, detail=f"Unsupported model format: {extension}")
+    _, dot, extension = (file.filename or "").rpartition(".")
+    extension = extension.lower() if dot else ""
+    if extension not in _SUPPORTED_SUFFIXES:
+        raise HTTPException(status_code=400, detail=f"Unsupported model format: {dot}{extension}")
 
-    data = await file.read()
-    record = model_lab.save_model(file.filename, data)
+    record = await model_lab.save_model(file.filename, _iter_upload(file))
     return {"model": record}
 
 
-@app.get("/api/models")
+@router.get("/api/models")
 async def api_list_models() -> Dict[str, object]:
     """Return metadata about stored models."""
 
-    return {"models": model_lab.list_models(), "active": get_active_model()}
+    models = await run_in_threadpool(model_lab.list_models)
+    return {"models": models, "active": get_active_model()}
 
 
-@app.post("/api/models/select/{name}")
+@router.post("/api/models/select/{name}")
 async def api_select_model(name: str) -> Dict[str, str]:
     """Set the active model for the local inference engine."""
 
     previous = get_active_model()
     try:
         model_lab.select_model(name)
-        local_ai.load_model(name)
+        await run_in_threadpool(local_ai.load_model, name)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except Exception as exc:  # pragma: no cover - loader specific errors
@@ -296,12 +386,12 @@ async def api_select_model(name: str) -> Dict[str, str]:
     return {"active_model": name}
 
 
-@app.delete("/api/models/delete/{name}")
+@router.delete("/api/models/delete/{name}")
 async def api_delete_model(name: str) -> Dict[str, str]:
     """Delete a stored model."""
 
     try:
-        model_lab.delete_model(name)
+        await run_in_threadpool(model_lab.delete_model, name)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     if get_active_model() is None:
@@ -309,33 +399,79 @@ async def api_delete_model(name: str) -> Dict[str, str]:
     return {"status": "deleted"}
 
 
-@app.post("/api/models/compare")
+@router.post("/api/models/compare")
 async def api_compare_models(payload: ModelCompareRequest) -> Dict[str, object]:
     """Compare two stored models."""
     try:
-        comparison = model_lab.compare_models(payload.first, payload.second)
+        comparison = await run_in_threadpool(model_lab.compare_models, payload.first, payload.second)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return {"comparison": comparison}
 
 
-@app.post("/api/models/optimize")
+@router.post("/api/models/optimize")
 async def api_optimize_models(payload: ModelCompareRequest) -> Dict[str, object]:
     """Run the placeholder optimisation routine."""
     try:
-        merged_name = model_lab.optimize_model(payload.first, payload.second)
+        merged_name = await run_in_threadpool(model_lab.optimize_model, payload.first, payload.second)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     return {"merged_model": merged_name}
 
 
-@app.get("/health")
+@router.get("/health")
 async def healthcheck() -> Dict[str, str]:
     """Simple health endpoint for monitoring."""
     return {"status": "ok", "projects_dir": str(PROJECTS_DIR), "models_dir": str(MODELS_DIR)}
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the database schema in the background while the server starts serving."""
+
+    task = asyncio.create_task(init_db_async())
+    try:
+        yield
+    finally:
+        task.cancel()
+        # commit chat messages still waiting in the writer queue
+        await message_writer.close()
+
+
+def create_app(*, enable_build_stream: bool = True, enable_chat: bool = True) -> FastAPI:
+    """Build the FastAPI application with the requested feature routers."""
+
+    app = FastAPI(
+        title="AI-WebForge",
+        description="Private AI-assisted web scaffold generator.",
+        default_response_class=ORJSONResponse,
+        lifespan=_lifespan,
+    )
+    app.mount("/static", StaticFiles(directory="static"), name="static")
+
+    if enable_chat:
+        app.include_router(chat_router)
+    app.include_router(models_router)
+    app.include_router(router)
+    if enable_build_stream:
+        app.include_router(build_router)
+    return app
+
+
+app = create_app()
+
+
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("app:app", host="0.0.0.0", port=8004, reload=False)
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8004,
+        reload=False,
+        http="httptools",
+        ws="websockets",
+        loop="auto",  # uvloop whenever it is installed
+        # build sessions live in process memory, so extra workers need sticky routing
+        workers=int(os.getenv("WEBFORGE_WORKERS", "1")),
+    )
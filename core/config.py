@@ -1,21 +1,34 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+import orjson
 
 CONFIG_PATH = Path("data") / "config.json"
 
+# (st_mtime_ns, parsed config) of the last read or write
+_cache: Optional[Tuple[int, dict]] = None
+
 
 def load_config() -> dict:
-    if CONFIG_PATH.exists():
-        return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-    return {"selected_model": None}
+    global _cache
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {"selected_model": None}
+    if _cache is not None and _cache[0] == mtime:
+        return dict(_cache[1])
+    cfg = orjson.loads(CONFIG_PATH.read_bytes())
+    _cache = (mtime, cfg)
+    return dict(cfg)
 
 
 def save_config(cfg: dict) -> None:
+    global _cache
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    CONFIG_PATH.write_bytes(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+    _cache = (CONFIG_PATH.stat().st_mtime_ns, dict(cfg))
 
 
 def get_selected_model() -> Optional[str]:
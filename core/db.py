@@ -1,11 +1,80 @@
+import asyncio
+import logging
 from pathlib import Path
 
-from sqlmodel import SQLModel, create_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+LOGGER = logging.getLogger(__name__)
 
 DB_PATH = Path("data") / "webforge.db"
-engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False})
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
+
+engine = create_async_engine(
+    f"sqlite+aiosqlite:///{DB_PATH}",
+    connect_args={"check_same_thread": False},
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    insertmanyvalues_page_size=10_000,
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _apply_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+# set once the schema exists; routes that touch the database wait on it
+_db_ready = asyncio.Event()
+
 
+def _create_schema(connection) -> None:
+    SQLModel.metadata.create_all(connection)
+    # create_all skips tables that already exist, so add indexes introduced since
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
-def init_db() -> None:
+
+async def init_db() -> None:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    SQLModel.metadata.create_all(engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(_create_schema)
+
+
+async def init_db_async() -> None:
+    """Run ``init_db`` and mark the database as ready."""
+
+    if _db_ready.is_set():
+        return
+    try:
+        await init_db()
+    except Exception:
+        LOGGER.exception("Database initialisation failed")
+    finally:
+        # never leave requests hanging; a failed setup surfaces as query errors
+        _db_ready.set()
+
+
+async def wait_until_ready() -> None:
+    """Block until ``init_db_async`` has finished."""
+
+    await _db_ready.wait()
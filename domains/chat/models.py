@@ -1,12 +1,14 @@
-from __future__ import annotations
-
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class ChatSession(SQLModel, table=True):
+    # SQLite walks the index backwards for ORDER BY created_at DESC
+    __table_args__ = (Index("ix_chatsession_created_at", "created_at"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(default="New Session")
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -14,9 +16,22 @@ class ChatSession(SQLModel, table=True):
 
 
 class ChatMessage(SQLModel, table=True):
+    __table_args__ = (Index("ix_chatmessage_session_created", "session_id", "created_at"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: int = Field(foreign_key="chatsession.id")
     role: str
     content: str
     created_at: datetime = Field(default_factory=datetime.utcnow)
     session: ChatSession = Relationship(back_populates="messages")
+
+
+class ChatCache(SQLModel, table=True):
+    # lets the expiry sweep in domains.chat.writer range-scan instead of reading every row
+    __table_args__ = (Index("ix_chatcache_expires_at", "expires_at"),)
+
+    # sha256 of (model, session, normalised prompt); see domains.chat.router._cache_key
+    key: str = Field(primary_key=True)
+    response: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime
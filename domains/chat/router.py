@@ -1,50 +1,129 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
-from sqlmodel import Session, select
+import asyncio
+import hashlib
+import io
+import threading
+from datetime import datetime, timedelta
+from typing import AsyncIterator
 
-from core.db import engine
-from domains.chat.models import ChatMessage, ChatSession
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from core.config import get_selected_model
+from core.db import SessionLocal, wait_until_ready
+from domains.chat.models import ChatCache, ChatMessage, ChatSession
+from domains.chat.writer import message_writer
 from services.llm import LLMService
 
-router = APIRouter(prefix="/api/chat", tags=["chat"])
+router = APIRouter(prefix="/api/chat", tags=["chat"], dependencies=[Depends(wait_until_ready)])
+
+# upper bound on characters coalesced into a single WebSocket frame
+STREAM_FLUSH_CHARS = 8192
+_STREAM_END = object()
+# how long a reply is reused for a repeated prompt in the same session
+CHAT_CACHE_TTL = timedelta(hours=1)
 
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str
     session_id: int | None = None
 
 
-def get_db():
-    with Session(engine) as session:
+async def get_db():
+    async with SessionLocal() as session:
         yield session
 
 
+async def _stream_batches(prompt: str) -> AsyncIterator[str]:
+    """Run the blocking token stream in a worker thread and yield whatever is ready.
+
+    Tokens that arrive while the previous frame is being sent are joined into one
+    string (up to ``STREAM_FLUSH_CHARS``) so each send carries more than a few bytes.
+    """
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for token in LLMService.stream(prompt):
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, token)
+        except Exception as exc:
+            loop.call_soon_threadsafe(queue.put_nowait, exc)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+    loop.run_in_executor(None, produce)
+    try:
+        finished = False
+        while not finished:
+            parts: list[str] = []
+            size = 0
+            item = await queue.get()
+            while True:
+                if item is _STREAM_END:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                parts.append(item)
+                size += len(item)
+                if size >= STREAM_FLUSH_CHARS or queue.empty():
+                    break
+                item = queue.get_nowait()
+            if parts:
+                yield "".join(parts)
+    finally:
+        stop.set()
+
+
+def _cache_key(session_id: int, text: str) -> str:
+    """Key replies by model, session and the prompt with case and spacing normalised."""
+
+    normalised = " ".join(text.lower().split())
+    raw = f"{get_selected_model()}\0{session_id}\0{normalised}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 @router.post("")
-def chat(payload: ChatRequest, db: Session = Depends(get_db)):
+async def chat(payload: ChatRequest):
     text = payload.text.strip()
-    session_id = payload.session_id
-    if not session_id:
-        session = ChatSession(title=text[:60] or "New Session")
-        db.add(session)
-        db.commit()
-        db.refresh(session)
-    else:
-        session = db.get(ChatSession, session_id)
-        if not session:
-            session = ChatSession(id=session_id, title="Session")
+    # sessions stay short-lived so no connection is checked out while the model runs
+    async with SessionLocal() as db, db.begin():
+        session = await db.get(ChatSession, payload.session_id) if payload.session_id else None
+        if session is None:
+            if payload.session_id:
+                session = ChatSession(id=payload.session_id, title="Session")
+            else:
+                session = ChatSession(title=text[:60] or "New Session")
             db.add(session)
-            db.commit()
-            db.refresh(session)
-
-    db.add(ChatMessage(session_id=session.id, role="user", content=text))
-    db.commit()
-
-    reply = LLMService.chat(text)
-    db.add(ChatMessage(session_id=session.id, role="assistant", content=reply))
-    db.commit()
-    return {"status": "ok", "session_id": session.id, "reply": reply}
+            await db.flush()
+        session_id = session.id
+        key = _cache_key(session_id, text)
+        cached = await db.get(ChatCache, key)
+
+    prompt_at = datetime.utcnow()
+    hit = cached is not None and cached.expires_at > prompt_at
+    reply = cached.response if hit else await run_in_threadpool(LLMService.chat, text)
+    now = datetime.utcnow()
+    # both messages and the cache refresh go out in one commit after generation
+    await message_writer.write(
+        [
+            {"session_id": session_id, "role": "user", "content": text, "created_at": prompt_at},
+            {"session_id": session_id, "role": "assistant", "content": reply, "created_at": now},
+        ],
+        cache=[] if hit else [{"key": key, "response": reply, "created_at": now, "expires_at": now + CHAT_CACHE_TTL}],
+    )
+    return {"status": "ok", "session_id": session_id, "reply": reply, "cached": hit}
 
 
 @router.websocket("/ws/{session_id}")
@@ -53,26 +132,24 @@ async def ws_chat(ws: WebSocket, session_id: int):
     try:
         first = await ws.receive_text()
         text = first.strip()
-        with Session(engine) as db:
-            session = db.get(ChatSession, session_id)
-            if not session:
-                session = ChatSession(id=session_id, title=text[:60] or "Session")
-                db.add(session)
-                db.commit()
-                db.refresh(session)
-            db.add(ChatMessage(session_id=session.id, role="user", content=text))
-            db.commit()
-
-        chunks: list[str] = []
-        for token in LLMService.stream(text):
-            chunks.append(token)
-            await ws.send_text(token)
-
-        reply = "".join(chunks)
-
-        with Session(engine) as db:
-            db.add(ChatMessage(session_id=session_id, role="assistant", content=reply))
-            db.commit()
+        # the user row is written last but keeps the time the prompt arrived
+        prompt_at = datetime.utcnow()
+
+        buffer = io.StringIO()
+        async for batch in _stream_batches(text):
+            buffer.write(batch)
+            await ws.send_text(batch)
+
+        reply = buffer.getvalue()
+
+        # the session row is created if missing in the same commit as the messages
+        await message_writer.write(
+            [
+                {"session_id": session_id, "role": "user", "content": text, "created_at": prompt_at},
+                {"session_id": session_id, "role": "assistant", "content": reply, "created_at": datetime.utcnow()},
+            ],
+            sessions=[{"id": session_id, "title": text[:60] or "Session", "created_at": prompt_at}],
+        )
 
         await ws.send_text("<|EOS|>")
     except WebSocketDisconnect:
@@ -82,19 +159,18 @@ async def ws_chat(ws: WebSocket, session_id: int):
 
 
 @router.get("/sessions")
-def list_sessions(db: Session = Depends(get_db)):
-    rows = db.exec(select(ChatSession).order_by(ChatSession.created_at.desc())).all()
+async def list_sessions(db: AsyncSession = Depends(get_db)):
+    rows = (await db.exec(select(ChatSession).order_by(ChatSession.created_at.desc()))).all()
     return rows
 
 
 @router.get("/messages/{session_id}")
-def list_messages(session_id: int, db: Session = Depends(get_db)):
+async def list_messages(session_id: int, db: AsyncSession = Depends(get_db)):
     rows = (
-        db.exec(
+        await db.exec(
             select(ChatMessage)
             .where(ChatMessage.session_id == session_id)
             .order_by(ChatMessage.created_at)
         )
-        .all()
-    )
+    ).all()
     return rows
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import delete, insert
+
+from core.db import SessionLocal
+from domains.chat.models import ChatCache, ChatMessage, ChatSession
+
+# upper bound on message rows committed in one transaction
+MAX_BATCH_ROWS = 128
+
+Row = Dict[str, Any]
+
+
+@dataclass
+class _Write:
+    messages: List[Row]
+    # ChatSession rows inserted unless a session with that id already exists
+    sessions: List[Row] = field(default_factory=list)
+    # ChatCache rows inserted or replacing the entry with the same key
+    cache: List[Row] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.messages) + len(self.sessions) + len(self.cache)
+
+
+class MessageWriter:
+    """Funnel chat message inserts from concurrent requests through one writer task.
+
+    While a commit is in flight, new rows queue up behind it and are committed
+    together next, so a burst of requests shares fsyncs instead of paying one each.
+    Callers still await their own rows being durable.
+    """
+
+    def __init__(self, max_batch: int = MAX_BATCH_ROWS) -> None:
+        self.max_batch = max_batch
+        self._queue: Optional["asyncio.Queue[Optional[Tuple[_Write, asyncio.Future]]]"] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _ensure_started(self) -> "asyncio.Queue[Optional[Tuple[_Write, asyncio.Future]]]":
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(self._queue))
+        return self._queue
+
+    async def write(
+        self,
+        rows: List[Row],
+        *,
+        sessions: Sequence[Row] = (),
+        cache: Sequence[Row] = (),
+    ) -> None:
+        """Insert ``rows`` into ``ChatMessage`` and return once they are committed.
+
+        ``sessions`` and ``cache`` rows are written in the same transaction, so an
+        exchange that also has to create its session or refresh the reply cache
+        still costs a single commit.
+        """
+
+        queue = self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((_Write(list(rows), list(sessions), list(cache)), future))
+        await future
+
+    async def close(self) -> None:
+        """Commit anything still queued and stop the writer task."""
+
+        if self._task is None or self._task.done():
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def _run(self, queue: "asyncio.Queue[Optional[Tuple[_Write, asyncio.Future]]]") -> None:
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                return
+            batch = [item]
+            size = len(item[0])
+            while size < self.max_batch and not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+            await self._commit(batch)
+
+    async def _commit(self, batch: List[Tuple[_Write, asyncio.Future]]) -> None:
+        sessions = [row for write, _ in batch for row in write.sessions]
+        messages = [row for write, _ in batch for row in write.messages]
+        cache = [row for write, _ in batch for row in write.cache]
+        try:
+            async with SessionLocal() as db, db.begin():
+                if sessions:
+                    await db.exec(sqlite_insert(ChatSession).on_conflict_do_nothing(), params=sessions)
+                if messages:
+                    await db.exec(insert(ChatMessage), params=messages)
+                if cache:
+                    # prune expired replies whenever new ones are stored, so the table stays bounded
+                    await db.exec(delete(ChatCache).where(ChatCache.expires_at < datetime.utcnow()))
+                    upsert = sqlite_insert(ChatCache)
+                    await db.exec(
+                        upsert.on_conflict_do_update(
+                            index_elements=[ChatCache.key],
+                            set_={column: upsert.excluded[column] for column in ("response", "created_at", "expires_at")},
+                        ),
+                        params=cache,
+                    )
+        except Exception as exc:
+            if len(batch) > 1:
+                # retry one by one so a bad row only fails its own caller
+                for item in batch:
+                    await self._commit([item])
+                return
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+
+
+message_writer = MessageWriter()
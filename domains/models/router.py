@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter
 
@@ -10,12 +11,27 @@ MODELS_DIR = Path("data/models")
 
 router = APIRouter(prefix="/api/models", tags=["models"])
 
+# (st_mtime_ns of MODELS_DIR, sorted .gguf paths) from the last directory scan
+_cache: Optional[Tuple[int, List[str]]] = None
+
+
+def _gguf_files() -> List[str]:
+    global _cache
+    try:
+        mtime = MODELS_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        MODELS_DIR.mkdir(parents=True, exist_ok=True)
+        mtime = MODELS_DIR.stat().st_mtime_ns
+    if _cache is not None and _cache[0] == mtime:
+        return list(_cache[1])
+    files = sorted(str(path) for path in MODELS_DIR.glob("*.gguf"))
+    _cache = (mtime, files)
+    return list(files)
+
 
 @router.get("")
 def list_models():
-    MODELS_DIR.mkdir(parents=True, exist_ok=True)
-    files = sorted(str(path) for path in MODELS_DIR.glob("*.gguf"))
-    return {"models": files, "selected": get_selected_model()}
+    return {"models": _gguf_files(), "selected": get_selected_model()}
 
 
 @router.post("/scan")
@@ -0,0 +1,138 @@
+"""Scaffold file templates used by ``ProjectManager.create_from_prompt``."""
+from __future__ import annotations
+
+import textwrap
+
+# The HTML and README templates are filled in with ``str.format_map``; the rest
+# are copied verbatim.
+SCAFFOLD_CSS = textwrap.dedent(
+    """
+    :root {
+        color-scheme: dark;
+        font-family: 'Inter', system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+    }
+
+    body {
+        margin: 0;
+        padding: 0;
+        min-height: 100vh;
+        background: radial-gradient(circle at top, #111927 0%, #05070a 100%);
+        color: #f8fafc;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+    }
+
+    .container {
+        width: min(960px, 90vw);
+        padding: 3rem;
+        background: rgba(15, 23, 42, 0.85);
+        border-radius: 24px;
+        border: 1px solid rgba(148, 163, 184, 0.12);
+        box-shadow: 0 24px 60px -32px rgba(0, 0, 0, 0.75);
+    }
+
+    .accent {
+        color: #00e19a;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 0.18em;
+    }
+
+    button {
+        background: linear-gradient(120deg, #00e19a 0%, #11f0aa 100%);
+        border: none;
+        color: #03110d;
+        padding: 0.85rem 1.6rem;
+        font-weight: 600;
+        border-radius: 999px;
+        cursor: pointer;
+        transition: transform 150ms ease, box-shadow 150ms ease;
+    }
+
+    button:hover {
+        transform: translateY(-1px);
+        box-shadow: 0 12px 20px -12px rgba(0, 225, 154, 0.55);
+    }
+    """
+).strip()
+
+SCAFFOLD_HTML = textwrap.dedent(
+    """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <title>{title}</title>
+        <link rel="stylesheet" href="./static/style.css">
+    </head>
+    <body>
+        <main class="container">
+            <p class="accent">{slug}</p>
+            <h1>{title}</h1>
+            <p>{description}</p>
+            <button id="cta">Launch Experience</button>
+        </main>
+        <script src="./static/script.js" defer></script>
+    </body>
+    </html>
+    """
+).strip()
+
+SCAFFOLD_JS = textwrap.dedent(
+    """
+    document.addEventListener('DOMContentLoaded', () => {
+        const button = document.querySelector('#cta');
+        if (!button) return;
+        button.addEventListener('click', () => {
+            button.textContent = 'Experience in progress…';
+            button.disabled = true;
+            setTimeout(() => {
+                button.textContent = 'Ready to Launch';
+                button.disabled = false;
+            }, 1200);
+        });
+    });
+    """
+).strip()
+
+SCAFFOLD_API = textwrap.dedent(
+    """
+    '''Minimal FastAPI application for the generated project.'''
+    from fastapi import FastAPI
+    from fastapi.responses import HTMLResponse
+    from pathlib import Path
+
+
+    app = FastAPI(title="Generated App")
+
+
+    @app.get("/", response_class=HTMLResponse)
+    async def index() -> HTMLResponse:
+        html_path = Path(__file__).resolve().parent.parent / "public" / "index.html"
+        return HTMLResponse(html_path.read_text(encoding="utf-8"))
+    """
+).strip()
+
+SCAFFOLD_README = textwrap.dedent(
+    """
+    # {title}
+
+    Generated locally by **AI-WebForge** on {generated_at}.
+
+    ## Overview
+
+    - Prompt: `{prompt}`
+    - Framework: FastAPI + static frontend assets
+    - Theme: Dark interface with neon green highlights
+
+    ## Getting Started
+
+    ```bash
+    uvicorn app.main:app --reload
+    ```
+
+    Then open http://127.0.0.1:8000 to explore the generated experience.
+    """
+).strip()
@@ -1,10 +1,14 @@
 """AI builder that interfaces with language models to scaffold projects."""
 from __future__ import annotations
 
-import json
 import os
+import re
+import string
+import threading
 from typing import Dict, Optional
 
+import orjson
+
 try:
     from openai import OpenAI
 except Exception:  # pragma: no cover - optional dependency import guard
@@ -20,20 +24,35 @@ DEFAULT_PROJECT_STRUCTURE = {
     "app/static/style.css": "body { font-family: Inter, sans-serif; background: #0f172a; color: white; }\n",
 }
 
+_INDEX_TEMPLATE_PATH = "app/templates/index.html"
+_TITLE_TEMPLATE = string.Template(DEFAULT_PROJECT_STRUCTURE[_INDEX_TEMPLATE_PATH].replace("{{ title }}", "$title"))
+_STATIC_FILES = {path: content for path, content in DEFAULT_PROJECT_STRUCTURE.items() if path != _INDEX_TEMPLATE_PATH}
+
+_GENERATE_RE = re.compile(r"\s*(?:create|build)", re.IGNORECASE)
+
 
 class AIBuilder:
     """High level interface for AI-assisted project scaffolding."""
 
     def __init__(self) -> None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        self.enabled = bool(api_key and OpenAI is not None)
-        self._client: Optional[OpenAI] = OpenAI(api_key=api_key) if self.enabled else None
+        self._api_key = os.getenv("OPENAI_API_KEY")
+        self.enabled = bool(self._api_key and OpenAI is not None)
+        # created on the first request rather than at import
+        self._client: Optional[OpenAI] = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> OpenAI:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = OpenAI(api_key=self._api_key)
+        return self._client
 
     def _call_openai(self, prompt: str) -> str:
-        if not self.enabled or self._client is None:
+        if not self.enabled:
             raise RuntimeError("OpenAI client not configured.")
 
-        response = self._client.responses.create(
+        response = self._get_client().responses.create(
             model="gpt-4.1-mini",
             input=prompt,
         )
@@ -45,10 +64,7 @@ class AIBuilder:
 
     def _fallback_project(self, prompt: str) -> Dict[str, str]:
         title = prompt.title()[:50] or "AI WebForge"
-        files = DEFAULT_PROJECT_STRUCTURE.copy()
-        index_html = files["app/templates/index.html"].replace("{{ title }}", title)
-        files["app/templates/index.html"] = index_html
-        return files
+        return {**_STATIC_FILES, _INDEX_TEMPLATE_PATH: _TITLE_TEMPLATE.substitute(title=title)}
 
     def generate_project(self, prompt: str) -> Dict[str, object]:
         """Generate a new project structure based on the provided prompt."""
@@ -69,7 +85,7 @@ class AIBuilder:
         files: Dict[str, str] = {}
         if ai_response:
             try:
-                parsed = json.loads(ai_response)
+                parsed = orjson.loads(ai_response)
                 if isinstance(parsed, dict):
                     files = {str(key): str(value) for key, value in parsed.items()}
             except Exception:
@@ -79,15 +95,13 @@ class AIBuilder:
             files = self._fallback_project(prompt)
 
         summary = f"Project scaffold generated for: {prompt}"
-        suffix = 1
-        final_name = project_name
-        while True:
-            try:
-                project_manager.create_project(final_name, files, summary=summary)
-                break
-            except FileExistsError:
-                suffix += 1
-                final_name = f"{project_name}-{suffix}"
+        final_name = project_manager.ensure_unique_name(project_name)
+        try:
+            project_manager.create_project(final_name, files, summary=summary)
+        except FileExistsError:
+            # another request claimed the name between the probe and the mkdir
+            final_name = project_manager.ensure_unique_name(project_name)
+            project_manager.create_project(final_name, files, summary=summary)
         return {
             "name": final_name,
             "files": files,
@@ -96,8 +110,7 @@ class AIBuilder:
 
     def chat(self, prompt: str) -> Dict[str, object]:
         """Return a chat response and optionally trigger project generation."""
-        prompt_lower = prompt.lower().strip()
-        should_generate = prompt_lower.startswith("create") or prompt_lower.startswith("build")
+        should_generate = _GENERATE_RE.match(prompt) is not None
 
         generated_project: Optional[Dict[str, object]] = None
         if should_generate:
@@ -108,7 +121,7 @@ class AIBuilder:
                 "\nFiles created: " + ", ".join(generated_project["files"].keys())
             )
         else:
-            if self.enabled and self._client is not None:
+            if self.enabled:
                 try:
                     message = self._call_openai(prompt)
                 except Exception:
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import re
 from dataclasses import dataclass
 from typing import Dict, List
 
@@ -10,6 +12,13 @@ from .code_executor import ExecutionContext, code_executor
 from .project_manager import project_manager
 from .utils import slugify
 
+LOGGER = logging.getLogger(__name__)
+
+# substring matches, mirroring the original ``keyword in prompt.lower()`` checks
+_BACKEND_RE = re.compile("api|backend|endpoint|service", re.IGNORECASE)
+_WEBSITE_RE = re.compile("website|landing|page|ui|interface", re.IGNORECASE)
+_ML_RE = re.compile("model|train|machine learning", re.IGNORECASE)
+
 
 @dataclass
 class BuildStep:
@@ -47,12 +56,11 @@ class AIController:
     """Interpret prompts and drive the building workflow."""
 
     def create_plan(self, prompt: str) -> BuildPlan:
-        prompt_lower = prompt.lower()
-        if any(keyword in prompt_lower for keyword in ("api", "backend", "endpoint", "service")):
+        if _BACKEND_RE.search(prompt):
             return self._plan_backend(prompt)
-        if any(keyword in prompt_lower for keyword in ("website", "landing", "page", "ui", "interface")):
+        if _WEBSITE_RE.search(prompt):
             return self._plan_website(prompt)
-        if any(keyword in prompt_lower for keyword in ("model", "train", "machine learning")):
+        if _ML_RE.search(prompt):
             return self._plan_ml(prompt)
         return self._plan_script(prompt)
 
@@ -453,6 +461,17 @@ class AIController:
         if session is None:
             return
         prompt = session.prompt.strip()
+        # events are buffered and handed over in one batch whenever the build yields
+        pending: List[Dict[str, object]] = []
+
+        def emit(event: Dict[str, object]) -> None:
+            pending.append(event)
+
+        def flush() -> None:
+            if pending:
+                build_stream.publish_many(session_id, pending)
+                pending.clear()
+
         build_stream.publish(session_id, {"type": "status", "stage": "understanding", "message": "Understanding request"})
         await asyncio.sleep(0.05)
         try:
@@ -468,8 +487,7 @@ class AIController:
                 plan=plan.to_dict(),
             )
             project_manager.append_history(candidate, {"type": "plan", "summary": plan.summary})
-            build_stream.publish(
-                session_id,
+            emit(
                 {
                     "type": "plan",
                     "plan": plan.to_dict(),
@@ -479,8 +497,7 @@ class AIController:
             context = ExecutionContext(session_id=session_id, project_name=candidate)
 
             for index, step in enumerate(plan.steps, start=1):
-                build_stream.publish(
-                    session_id,
+                emit(
                     {
                         "type": "step",
                         "status": "start",
@@ -501,8 +518,7 @@ class AIController:
                 )
 
                 async def on_write(path: str, content: str) -> None:
-                    build_stream.publish(
-                        session_id,
+                    emit(
                         {
                             "type": "file",
                             "path": path,
@@ -510,6 +526,7 @@ class AIController:
                             "step": index,
                         },
                     )
+                    flush()
                     project_manager.append_history(
                         candidate,
                         {
@@ -519,10 +536,11 @@ class AIController:
                         },
                     )
 
+                # hand over the plan/step-start events before yielding to the file writes
+                flush()
                 await code_executor.apply_files(context, step.files, on_write=on_write)
 
-                build_stream.publish(
-                    session_id,
+                emit(
                     {
                         "type": "step",
                         "status": "complete",
@@ -543,8 +561,7 @@ class AIController:
                 candidate,
                 {"type": "complete", "message": "Build finished"},
             )
-            build_stream.publish(
-                session_id,
+            emit(
                 {
                     "type": "complete",
                     "project": candidate,
@@ -552,19 +569,29 @@ class AIController:
                 },
             )
         except Exception as exc:  # pragma: no cover - defensive
-            if session.project_name:
-                project_manager.append_history(
-                    session.project_name,
-                    {"type": "error", "message": str(exc)},
-                )
-            build_stream.publish(
-                session_id,
+            # the terminal event goes out first so clients are released even if recording it fails
+            emit(
                 {
                     "type": "error",
                     "message": str(exc),
                 },
             )
+            if session.project_name:
+                try:
+                    project_manager.append_history(
+                        session.project_name,
+                        {"type": "error", "message": str(exc)},
+                    )
+                except Exception:  # e.g. the project was deleted mid-build
+                    LOGGER.exception("Could not record build error for '%s'.", session.project_name)
         finally:
+            if session.project_name:
+                # history is written behind; make it durable before clients see the build end
+                try:
+                    project_manager.flush_manifest(session.project_name)
+                except Exception:
+                    LOGGER.exception("Could not flush manifest for '%s'.", session.project_name)
+            flush()
             build_stream.close(session_id)
 
 
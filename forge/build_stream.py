@@ -2,10 +2,19 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
 from uuid import uuid4
 
+MAX_BATCH_SIZE = 128
+HISTORY_LIMIT = 1000
+# events a slow consumer may fall behind by before the oldest are dropped
+QUEUE_LIMIT = 1024
+# how long finished sessions stay around for late history replays
+SESSION_TTL = 600.0
+
 
 class BuildSession:
     """Container for streaming build events tied to a single request."""
@@ -15,9 +24,32 @@ class BuildSession:
         self.prompt = prompt
         self.project_name: Optional[str] = None
         self.created_at = datetime.utcnow().isoformat() + "Z"
-        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
-        self.history: List[Dict[str, Any]] = []
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=QUEUE_LIMIT)
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=HISTORY_LIMIT)
         self.completed = False
+        self.completed_at: Optional[float] = None
+
+    def enqueue(self, event: Dict[str, Any]) -> None:
+        """Queue an event, discarding the oldest pending one when the queue is full."""
+
+        queue = self.queue
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+    def mark_completed(self) -> None:
+        if not self.completed:
+            self.completed = True
+            self.completed_at = time.monotonic()
+
+    def drain(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Remove and return queued events without waiting."""
+
+        queue = self.queue
+        ready: List[Dict[str, Any]] = []
+        while not queue.empty() and (limit is None or len(ready) < limit):
+            ready.append(queue.get_nowait())
+        return ready
 
     def snapshot(self) -> Dict[str, Any]:
         return {
@@ -37,6 +69,7 @@ class BuildStream:
         self._lock = asyncio.Lock()
 
     def create_session(self, prompt: str) -> BuildSession:
+        self._sweep()
         session = BuildSession(prompt)
         self._sessions[session.id] = session
         return session
@@ -53,9 +86,36 @@ class BuildStream:
             event = await session.queue.get()
             yield event
             if event.get("type") in {"complete", "error"}:
-                session.completed = True
+                session.mark_completed()
                 break
 
+    async def stream_batches(
+        self,
+        session_id: str,
+        max_batch: int = MAX_BATCH_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield lists of events, coalescing everything already queued behind the first."""
+
+        session = self.get_session(session_id)
+        if session is None:
+            raise KeyError(f"Session {session_id} not found")
+
+        while True:
+            batch = [await session.queue.get()]
+            batch.extend(self.drain_ready(session_id, max_batch - 1))
+            yield batch
+            if any(event.get("type") in {"complete", "error"} for event in batch):
+                session.mark_completed()
+                break
+
+    def drain_ready(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return queued events that are available without waiting."""
+
+        session = self.get_session(session_id)
+        if session is None:
+            return []
+        return session.drain(limit)
+
     def publish(self, session_id: str, event: Dict[str, Any]) -> None:
         session = self.get_session(session_id)
         if session is None:
@@ -64,7 +124,25 @@ class BuildStream:
         enriched = dict(event)
         enriched.setdefault("timestamp", datetime.utcnow().isoformat() + "Z")
         session.history.append(enriched)
-        session.queue.put_nowait(enriched)
+        session.enqueue(enriched)
+
+    def publish_many(self, session_id: str, events: List[Dict[str, Any]]) -> None:
+        """Publish several events at once, sharing a single timestamp and lookup."""
+
+        session = self.get_session(session_id)
+        if session is None or not events:
+            return
+
+        timestamp = datetime.utcnow().isoformat() + "Z"
+        enriched_events = []
+        for event in events:
+            enriched = dict(event)
+            enriched.setdefault("timestamp", timestamp)
+            enriched_events.append(enriched)
+        session.history.extend(enriched_events)
+        enqueue = session.enqueue
+        for enriched in enriched_events:
+            enqueue(enriched)
 
     def prime(self, session_id: str, event: Dict[str, Any]) -> None:
         """Immediately add an event to the session history without queueing."""
@@ -80,10 +158,23 @@ class BuildStream:
         session = self.get_session(session_id)
         if session is None:
             return
-        session.completed = True
+        session.mark_completed()
 
     def drop(self, session_id: str) -> None:
         self._sessions.pop(session_id, None)
+        self._sweep()
+
+    def _sweep(self) -> None:
+        """Forget sessions that finished more than ``SESSION_TTL`` seconds ago."""
+
+        cutoff = time.monotonic() - SESSION_TTL
+        expired = [
+            session_id
+            for session_id, session in self._sessions.items()
+            if session.completed_at is not None and session.completed_at < cutoff
+        ]
+        for session_id in expired:
+            del self._sessions[session_id]
 
 
 build_stream = BuildStream()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 from dataclasses import dataclass
 from typing import Awaitable, Callable, Dict, Optional
 
@@ -22,16 +23,26 @@ class CodeExecutor:
         context: ExecutionContext,
         files: Dict[str, str],
         *,
-        delay: float = 0.05,
+        delay: float = 0.0,
         on_write: Optional[Callable[[str, str], Awaitable[None]]] = None,
     ) -> None:
-        """Write a bundle of files to disk with optional delay for streaming."""
-
+        """Write a bundle of files to disk concurrently, then report each one in order.
+
+        ``delay`` optionally paces the ``on_write`` callbacks; the writes never wait on it.
+        """
+
+        loop = asyncio.get_running_loop()
+        name = context.project_name
+        save = functools.partial(project_manager.save_file, touch_manifest=False)
+        await asyncio.gather(*(loop.run_in_executor(None, save, name, path, content) for path, content in files.items()))
+        # one manifest rewrite for the whole bundle instead of one per file
+        if files:
+            await loop.run_in_executor(None, project_manager.update_manifest, name)
+        if on_write is None:
+            return
         for path, content in files.items():
-            project_manager.save_file(context.project_name, path, content)
-            if on_write is not None:
-                await on_write(path, content)
-            await asyncio.sleep(delay)
-
+            await on_write(path, content)
+            if delay:
+                await asyncio.sleep(delay)
 
 code_executor = CodeExecutor()
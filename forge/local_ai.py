@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -34,12 +35,10 @@ class LocalAIEngine:
         self._model: Optional[object] = None
         self._tokenizer: Optional[object] = None
         self._generator: Callable[[str], str] = self._default_generator
+        # the configured name is read eagerly, the weights only on first use
         self._active_model: Optional[str] = get_active_model()
-        if self._active_model:
-            try:
-                self.load_model(self._active_model)
-            except Exception:  # pragma: no cover - best effort lazy load
-                LOGGER.exception("Failed to eagerly load configured model '%s'.", self._active_model)
+        self._loaded = False
+        self._load_lock = threading.RLock()
 
     # ------------------------------------------------------------------
     # model management
@@ -47,6 +46,11 @@ class LocalAIEngine:
     def load_model(self, model_name: str) -> None:
         """Load a local model and prepare an inference pipeline."""
 
+        with self._load_lock:
+            self._load_model(model_name)
+            self._loaded = True
+
+    def _load_model(self, model_name: str) -> None:
         model_path = MODELS_DIR / model_name
         if not model_path.exists():
             raise FileNotFoundError(f"Model '{model_name}' not found in {MODELS_DIR}.")
@@ -84,24 +88,41 @@ class LocalAIEngine:
     def generate_response(self, prompt: str) -> str:
         """Generate a text response using the active model."""
 
-        if not self._active_model:
-            available = sorted(p.name for p in MODELS_DIR.iterdir() if p.is_file())
-            if available:
-                self.load_model(available[0])
+        if not self._loaded:
+            self._ensure_loaded()
         try:
             return self._generator(prompt)
         except Exception:  # pragma: no cover - runtime guard
             LOGGER.exception("Local generation failed; using fallback response.")
             return self._default_generator(prompt)
 
+    def _ensure_loaded(self) -> None:
+        """Load the configured (or first available) model on first use."""
+
+        with self._load_lock:
+            if self._loaded:
+                return
+            if self._active_model:
+                try:
+                    self.load_model(self._active_model)
+                except Exception:  # pragma: no cover - best effort lazy load
+                    LOGGER.exception("Failed to load configured model '%s'.", self._active_model)
+                    self._loaded = True
+                return
+            available = sorted(p.name for p in MODELS_DIR.iterdir() if p.is_file())
+            if available:
+                self.load_model(available[0])
+
     def clear_model(self) -> None:
         """Reset the active model and revert to template responses."""
 
-        self._model = None
-        self._tokenizer = None
-        self._generator = self._default_generator
-        self._active_model = None
-        set_active_model(None)
+        with self._load_lock:
+            self._model = None
+            self._tokenizer = None
+            self._generator = self._default_generator
+            self._active_model = None
+            self._loaded = False
+            set_active_model(None)
 
     # ------------------------------------------------------------------
     # loader helpers
@@ -1,22 +1,47 @@
 """Model management utilities for AI-WebForge."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
+import math
+import mmap
+import os
+import struct
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import AsyncIterator, BinaryIO, Dict, List, Optional
+
+import orjson
 
 try:  # pragma: no cover - optional dependency
     import torch
 except Exception:  # pragma: no cover - optional dependency
     torch = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency
+    from blake3 import blake3
+except Exception:  # pragma: no cover - optional dependency
+    blake3 = None  # type: ignore
+
 from .utils import MODELS_DIR, get_active_model, human_readable_size, set_active_model
 
 
 SUPPORTED_EXTENSIONS = {".pt", ".onnx", ".gguf", ".safetensors"}
+UPLOAD_CHUNK_SIZE = 1 << 20
+# upper bound on a safetensors JSON header, as set by the format specification
+SAFETENSORS_MAX_HEADER = 100_000_000
+# hashes only identify files, so the faster blake3 is preferred when installed
+HASH_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
+
+def _new_hasher():
+    return blake3() if blake3 is not None else hashlib.sha256()
+
+
+def _write_and_hash(out: BinaryIO, hasher, chunk: bytes) -> None:
+    hasher.update(chunk)
+    out.write(chunk)
 
 
 @dataclass
@@ -53,27 +78,69 @@ class ModelLab:
         return self.base_dir / f"{filename}.meta.json"
 
     def _hash_file(self, file_path: Path) -> str:
-        hasher = hashlib.sha256()
+        hasher = _new_hasher()
         with file_path.open("rb") as fh:
-            for chunk in iter(lambda: fh.read(8192), b""):
-                hasher.update(chunk)
+            if os.fstat(fh.fileno()).st_size:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hasher.update(mapped)
         return hasher.hexdigest()
 
-    def save_model(self, filename: str, data: bytes) -> Dict[str, str]:
-        """Persist a new model file to disk and return its metadata."""
+    @staticmethod
+    def _stamp(record: Dict[str, object], stat: os.stat_result) -> Dict[str, object]:
+        """Record which file version ``record["hash"]`` was computed from."""
+
+        record["hash_algorithm"] = HASH_ALGORITHM
+        record["mtime_ns"] = stat.st_mtime_ns
+        record["bytes"] = stat.st_size
+        return record
+
+    def _cached_hash(self, file_path: Path) -> str:
+        """Return the file hash, reusing the sidecar value while the file is unchanged."""
+
+        stat = file_path.stat()
+        metadata_path = self._metadata_path(file_path.name)
+        try:
+            record = orjson.loads(metadata_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            record = None
+        if (
+            record is not None
+            and record.get("hash_algorithm") == HASH_ALGORITHM
+            and record.get("mtime_ns") == stat.st_mtime_ns
+            and record.get("bytes") == stat.st_size
+        ):
+            return record["hash"]
+
+        file_hash = self._hash_file(file_path)
+        if record is not None:
+            record["hash"] = file_hash
+            metadata_path.write_bytes(orjson.dumps(self._stamp(record, stat), option=orjson.OPT_INDENT_2))
+        return file_hash
+
+    async def save_model(self, filename: str, chunks: AsyncIterator[bytes]) -> Dict[str, str]:
+        """Stream an uploaded model to disk, hashing it in the same pass, and return its metadata."""
         target_path = self.base_dir / filename
-        target_path.write_bytes(data)
-        file_hash = self._hash_file(target_path)
+        hasher = _new_hasher()
+        out = await asyncio.to_thread(target_path.open, "wb")
+        try:
+            async for chunk in chunks:
+                await asyncio.to_thread(_write_and_hash, out, hasher, chunk)
+        finally:
+            await asyncio.to_thread(out.close)
+        return await asyncio.to_thread(self._record_upload, filename, target_path, hasher.hexdigest())
+
+    def _record_upload(self, filename: str, target_path: Path, file_hash: str) -> Dict[str, str]:
+        stat = target_path.stat()
         metadata = ModelMetadata(
             name=filename,
             path=target_path,
-            size=target_path.stat().st_size,
+            size=stat.st_size,
             hash=file_hash,
         )
         record = metadata.to_dict()
         record["uploaded_at"] = datetime.utcnow().isoformat()
         record["parameters"] = self._estimate_parameters(target_path)
-        self._metadata_path(filename).write_text(json.dumps(record, indent=2), encoding="utf-8")
+        self._metadata_path(filename).write_bytes(orjson.dumps(self._stamp(record, stat), option=orjson.OPT_INDENT_2))
         if not get_active_model():
             set_active_model(filename)
         record["active"] = record["name"] == get_active_model()
@@ -87,21 +154,23 @@ class ModelLab:
                 metadata_path = self._metadata_path(path.name)
                 if metadata_path.exists():
                     try:
-                        payload = json.loads(metadata_path.read_text())
+                        payload = orjson.loads(metadata_path.read_bytes())
                         payload.setdefault("active", payload.get("name") == get_active_model())
                         models.append(payload)
                         continue
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         pass
-                file_hash = self._hash_file(path)
+                stat = path.stat()
                 payload = ModelMetadata(
                     name=path.name,
                     path=path,
-                    size=path.stat().st_size,
-                    hash=file_hash,
+                    size=stat.st_size,
+                    hash=self._hash_file(path),
                 ).to_dict()
                 payload["uploaded_at"] = datetime.utcnow().isoformat()
                 payload["parameters"] = self._estimate_parameters(path)
+                # persist so later listings and comparisons skip the re-hash
+                metadata_path.write_bytes(orjson.dumps(self._stamp(payload, stat), option=orjson.OPT_INDENT_2))
                 payload["active"] = payload["name"] == get_active_model()
                 models.append(payload)
         return models
@@ -117,13 +186,13 @@ class ModelLab:
             name=first,
             path=first_path,
             size=first_path.stat().st_size,
-            hash=self._hash_file(first_path),
+            hash=self._cached_hash(first_path),
         )
         second_meta = ModelMetadata(
             name=second,
             path=second_path,
             size=second_path.stat().st_size,
-            hash=self._hash_file(second_path),
+            hash=self._cached_hash(second_path),
         )
 
         comparison = {
@@ -172,12 +241,17 @@ class ModelLab:
     # helpers
     # ------------------------------------------------------------------
     def _estimate_parameters(self, path: Path) -> Optional[str]:
-        """Return a lightweight parameter estimate for PyTorch models."""
+        """Return a lightweight parameter estimate for PyTorch and safetensors models."""
 
-        if torch is None or path.suffix.lower() not in {".pt", ".pth", ".safetensors"}:
+        suffix = path.suffix.lower()
+        if suffix == ".safetensors":
+            total = self._count_safetensors_parameters(path)
+            return f"{total:,}" if total else None
+        if torch is None or suffix not in {".pt", ".pth"}:
             return None
         try:
-            weights = torch.load(path, map_location="cpu")  # type: ignore[call-arg]
+            # mmap keeps tensor storage on disk; numel() only needs the shapes
+            weights = torch.load(path, map_location="cpu", mmap=True, weights_only=True)  # type: ignore[call-arg]
         except Exception:  # pragma: no cover - best effort
             return None
         if isinstance(weights, dict) and "state_dict" in weights:
@@ -188,5 +262,25 @@ class ModelLab:
                 return f"{total:,}"
         return None
 
+    @staticmethod
+    def _count_safetensors_parameters(path: Path) -> Optional[int]:
+        """Sum tensor sizes from the safetensors JSON header without reading any weights."""
+
+        try:
+            with path.open("rb") as fh:
+                (header_size,) = struct.unpack("<Q", fh.read(8))
+                # the length prefix is untrusted; never read past the file or the spec's cap
+                if header_size > min(SAFETENSORS_MAX_HEADER, path.stat().st_size - 8):
+                    return None
+                header = orjson.loads(fh.read(header_size))
+            if not isinstance(header, dict):
+                return None
+            return sum(
+                math.prod(entry.get("shape", ()))
+                for key, entry in header.items()
+                if key != "__metadata__" and isinstance(entry, dict)
+            )
+        except (OSError, struct.error, ValueError, TypeError, AttributeError):
+            return None
 
 model_lab = ModelLab()
@@ -1,16 +1,110 @@
 """Project management utilities for AI-WebForge."""
 from __future__ import annotations
 
-import io
-import json
+import atexit
+import logging
+import os
 import shutil
-import textwrap
+import threading
+import time
 import zipfile
-from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from .utils import PROJECTS_DIR, collect_directory_tree, slugify
+import orjson
+
+try:  # pragma: no cover - optional dependency
+    from zipstream import ZipStream
+except Exception:  # pragma: no cover - optional dependency
+    ZipStream = None  # type: ignore
+
+from ._scaffold_templates import SCAFFOLD_API, SCAFFOLD_CSS, SCAFFOLD_HTML, SCAFFOLD_JS, SCAFFOLD_README
+from .utils import PROJECTS_DIR, atomic_write_bytes, collect_directory_tree, slugify
+
+LOGGER = logging.getLogger(__name__)
+
+FILE_CACHE_SIZE = 128
+# bytes of compressed output buffered before a zip chunk is handed to the response
+ZIP_CHUNK_SIZE = 64 * 1024
+# scaffolds are small text files; level 1 costs a few percent in size for a fraction of the CPU
+ZIP_COMPRESSLEVEL = 1
+# already compressed formats; deflating them again only burns CPU
+_STORED_EXTENSIONS = frozenset(
+    {".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico", ".woff", ".woff2", ".ttf", ".otf",
+     ".zip", ".gz", ".br", ".mp3", ".mp4", ".webm"}
+)
+# most recent history events kept in a manifest
+HISTORY_LIMIT = 200
+# append_history rewrites the manifest after this many events or this many seconds
+HISTORY_FLUSH_EVENTS = 8
+HISTORY_FLUSH_INTERVAL = 0.5
+# below this many files reads and writes run serially; a thread pool would cost more than it saves
+PARALLEL_IO_THRESHOLD = 4
+
+
+def _utc_timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _copy_manifest(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    # cached manifests are shared, so callers get their own dict and history list
+    copy = dict(manifest)
+    if "history" in copy:
+        copy["history"] = list(copy["history"])
+    return copy
+
+
+def _zip_compress_type(name: str) -> int:
+    return zipfile.ZIP_STORED if os.path.splitext(name)[1].lower() in _STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+
+def _read_text(path: str) -> str:
+    with open(path, "rb") as handle:
+        return handle.read().decode("utf-8", errors="ignore")
+
+
+def _write_text(item: Tuple[Path, str]) -> None:
+    file_path, content = item
+    file_path.write_bytes(content.encode("utf-8"))
+
+
+def _walk_files(root: Path) -> Iterator[Tuple[str, str]]:
+    """Yield ``(absolute_path, relative_path)`` for every file below ``root``.
+
+    Relative paths use ``/`` separators and are built by string joins, so no
+    ``Path`` objects or extra ``stat`` calls are made per entry.
+    """
+    root_s = str(root)
+    prefix_len = len(root_s) + 1
+    for dirpath, _dirnames, filenames in os.walk(root_s):
+        prefix = dirpath[prefix_len:].replace(os.sep, "/") + "/" if len(dirpath) > prefix_len else ""
+        for filename in filenames:
+            yield dirpath + os.sep + filename, prefix + filename
+
+
+class _ChunkBuffer:
+    """Write-only file object that collects zip output until it is drained."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
 
 
 class ProjectManager:
@@ -19,6 +113,20 @@ class ProjectManager:
     def __init__(self, base_dir: Path = PROJECTS_DIR) -> None:
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # listings keyed by the st_mtime_ns of the directory they were read from
+        self._projects_cache: Optional[Tuple[int, List[Dict[str, str]]]] = None
+        self._files_cache: Dict[str, Tuple[int, List[str]]] = {}
+        # (project, path) -> (st_mtime_ns, st_size, content), least recently used first
+        self._file_cache: "OrderedDict[Tuple[str, str], Tuple[int, int, str]]" = OrderedDict()
+        self._file_cache_lock = threading.Lock()
+        # manifest updates are read-modify-write and may come from worker threads
+        self._manifest_lock = threading.RLock()
+        # project -> (st_mtime_ns, st_size, parsed manifest); entries are never mutated in place
+        self._manifest_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+        # project -> (manifest with history not yet written, number of unwritten events)
+        self._dirty: Dict[str, Tuple[Dict[str, Any], int]] = {}
+        self._last_flush: Dict[str, float] = {}
+        atexit.register(self.flush_manifests)
 
     def _project_path(self, name: str) -> Path:
         return self.base_dir / name
@@ -26,21 +134,71 @@ class ProjectManager:
     def _manifest_path(self, name: str) -> Path:
         return self._project_path(name) / "manifest.json"
 
+    def exists(self, name: str) -> bool:
+        """Return whether a project directory called ``name`` exists."""
+
+        return self._project_path(name).is_dir()
+
+    def _tree_cache_path(self, name: str) -> Path:
+        # kept beside the project so it never shows up in listings or archives
+        return self.base_dir / f".{name}.tree.json"
+
+    def _invalidate(self, name: Optional[str] = None) -> None:
+        """Drop cached listings affected by a change to ``name``."""
+
+        self._projects_cache = None
+        if name is not None:
+            self._files_cache.pop(name, None)
+
+    def _forget_files(self, name: str) -> None:
+        """Evict every cached file body belonging to ``name``."""
+
+        with self._file_cache_lock:
+            for key in [key for key in self._file_cache if key[0] == name]:
+                del self._file_cache[key]
+
     def load_manifest(self, name: str) -> Dict[str, Any]:
         """Return the stored manifest for a project, if it exists."""
 
+        if name in self._dirty:
+            with self._manifest_lock:
+                pending = self._dirty.get(name)
+                if pending is not None:
+                    return _copy_manifest(pending[0])
         manifest_path = self._manifest_path(name)
-        if not manifest_path.exists():
+        try:
+            stat = manifest_path.stat()
+        except FileNotFoundError:
+            self._manifest_cache.pop(name, None)
             return {}
+        cached = self._manifest_cache.get(name)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return _copy_manifest(cached[2])
         try:
-            return json.loads(manifest_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
+            manifest = orjson.loads(manifest_path.read_bytes())
+        except orjson.JSONDecodeError:
             return {}
+        self._manifest_cache[name] = (stat.st_mtime_ns, stat.st_size, manifest)
+        return _copy_manifest(manifest)
 
     def _write_manifest(self, name: str, manifest: Dict[str, Any]) -> None:
+        # the project directory already exists (create_project/initialize_project), so
+        # writing into a deleted project fails loudly instead of resurrecting it
         manifest_path = self._manifest_path(name)
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        if isinstance(manifest.get("history"), deque):
+            manifest = {**manifest, "history": list(manifest["history"])}
+        try:
+            atomic_write_bytes(manifest_path, orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        except Exception:
+            # a pending manifest that cannot be written would otherwise shadow the disk forever
+            self._dirty.pop(name, None)
+            raise
+        stat = manifest_path.stat()
+        # seed the cache with what was just written so the next load skips the parse
+        self._manifest_cache[name] = (stat.st_mtime_ns, stat.st_size, _copy_manifest(manifest))
+        self._dirty.pop(name, None)
+        self._last_flush[name] = time.monotonic()
+        self._invalidate()
 
     def _default_manifest(
         self,
@@ -51,7 +209,7 @@ class ProjectManager:
     ) -> Dict[str, Any]:
         """Return a base manifest structure for a project."""
 
-        now = datetime.utcnow().isoformat() + "Z"
+        now = _utc_timestamp()
         manifest: Dict[str, Any] = {
             "name": name,
             "summary": summary,
@@ -64,43 +222,94 @@ class ProjectManager:
         return manifest
 
     def append_history(self, name: str, event: Dict[str, Any]) -> None:
-        """Append an event to the project manifest history."""
-
-        manifest = self.load_manifest(name) or self._default_manifest(name, "")
-        history = manifest.setdefault("history", [])
-        timestamp = datetime.utcnow().isoformat() + "Z"
-        event.setdefault("timestamp", timestamp)
-        history.append(event)
-        manifest["updated_at"] = timestamp
-        # keep history reasonable in size
-        if len(history) > 200:
-            manifest["history"] = history[-200:]
-        self._write_manifest(name, manifest)
+        """Append an event to the project manifest history.
+
+        Writes are coalesced: the manifest is rewritten once ``HISTORY_FLUSH_EVENTS``
+        events are pending or ``HISTORY_FLUSH_INTERVAL`` seconds have passed since
+        the last write, otherwise the event only lands in memory (and is already
+        visible to ``load_manifest``). ``flush_manifest`` forces the write; events
+        still pending at a crash are lost, at most a handful per project.
+        """
+
+        with self._manifest_lock:
+            manifest, pending = self._dirty.get(name, (None, 0))
+            if manifest is None:
+                if not self._project_path(name).is_dir():
+                    # deleted while a build was still reporting; there is nowhere to record it
+                    return
+                manifest = self.load_manifest(name) or self._default_manifest(name, "")
+                # the pending copy owns its history, so later events append in place
+                manifest["history"] = deque(manifest.get("history", ()), maxlen=HISTORY_LIMIT)
+            timestamp = _utc_timestamp()
+            event.setdefault("timestamp", timestamp)
+            manifest["history"].append(event)
+            manifest["updated_at"] = timestamp
+            pending += 1
+            last_flush = self._last_flush.get(name, 0.0)
+            if pending >= HISTORY_FLUSH_EVENTS or time.monotonic() - last_flush >= HISTORY_FLUSH_INTERVAL:
+                self._write_manifest(name, manifest)
+            else:
+                self._dirty[name] = (manifest, pending)
+
+    def flush_manifest(self, name: str) -> None:
+        """Write out history events that ``append_history`` is still holding back."""
+
+        with self._manifest_lock:
+            pending = self._dirty.get(name)
+            if pending is not None:
+                self._write_manifest(name, pending[0])
+
+    def flush_manifests(self) -> None:
+        """Flush pending history for every project; registered to run at exit."""
+
+        with self._manifest_lock:
+            for name in list(self._dirty):
+                try:
+                    self.flush_manifest(name)
+                except Exception:
+                    # keep going so one broken project does not cost the others their history
+                    LOGGER.exception("Could not flush manifest for '%s'.", name)
 
     def update_manifest(self, name: str, **fields: Any) -> None:
         """Update specific fields in the manifest."""
 
-        manifest = self.load_manifest(name)
-        if not manifest:
-            manifest = self._default_manifest(name, fields.get("summary", ""))
-        manifest.update(fields)
-        manifest["updated_at"] = datetime.utcnow().isoformat() + "Z"
-        self._write_manifest(name, manifest)
+        with self._manifest_lock:
+            manifest = self.load_manifest(name)
+            if not manifest:
+                manifest = self._default_manifest(name, fields.get("summary", ""))
+            manifest.update(fields)
+            manifest["updated_at"] = _utc_timestamp()
+            self._write_manifest(name, manifest)
 
-    def ensure_unique_name(self, desired: str) -> str:
-        """Return a unique project name based on the desired slug."""
+    def _existing_names(self) -> Set[str]:
+        with os.scandir(self.base_dir) as entries:
+            return {entry.name for entry in entries}
+
+    def ensure_unique_name(self, desired: str, taken: Optional[Set[str]] = None) -> str:
+        """Return a unique project name based on the desired slug.
+
+        ``base_dir`` is listed once and candidates are checked against that
+        snapshot; pass ``taken`` to reuse a snapshot across several calls.
+        """
 
         if not desired:
             desired = "project"
+        if taken is None:
+            taken = self._existing_names()
         candidate = desired
         counter = 1
-        while self._project_path(candidate).exists():
+        while candidate in taken:
             counter += 1
             candidate = f"{desired}-{counter}"
         return candidate
 
     def list_projects(self) -> List[Dict[str, str]]:
         """Return metadata about all saved projects."""
+        mtime = self.base_dir.stat().st_mtime_ns
+        cached = self._projects_cache
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
         projects: List[Dict[str, str]] = []
         for path in sorted(self.base_dir.iterdir()):
             if path.is_dir():
@@ -115,7 +324,8 @@ class ProjectManager:
                         "updated_at": manifest.get("updated_at") if manifest else None,
                     }
                 )
-        return projects
+        self._projects_cache = (mtime, projects)
+        return list(projects)
 
     def create_project(self, name: str, files: Dict[str, str], summary: str = "") -> Path:
         """Create a project directory populated with the provided files."""
@@ -124,11 +334,18 @@ class ProjectManager:
             raise FileExistsError(f"Project '{name}' already exists.")
 
         project_dir.mkdir(parents=True, exist_ok=False)
-
-        for relative_path, content in files.items():
-            file_path = project_dir / relative_path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding="utf-8")
+        self._invalidate(name)
+
+        items = [(project_dir / relative_path, content) for relative_path, content in files.items()]
+        # one mkdir per distinct directory rather than one per file
+        for parent in {file_path.parent for file_path, _content in items} - {project_dir}:
+            parent.mkdir(parents=True, exist_ok=True)
+        if len(items) < PARALLEL_IO_THRESHOLD:
+            for item in items:
+                _write_text(item)
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(items))) as pool:
+                list(pool.map(_write_text, items))
 
         manifest = self._default_manifest(name, summary, stack="generated")
         self._write_manifest(name, manifest)
@@ -156,18 +373,18 @@ class ProjectManager:
         """Generate a scaffolded project using the provided natural language prompt."""
 
         slug = slugify(prompt)
-        base_name = slug or f"project-{datetime.utcnow():%Y%m%d%H%M%S}"
+        base_name = slug or f"project-{datetime.now(timezone.utc):%Y%m%d%H%M%S}"
         summary = f"Generated from prompt: {prompt.strip()[:140]}"
         files = self._render_scaffold(prompt)
 
-        counter = 1
-        project_name = base_name
+        taken = self._existing_names()
         while True:
+            project_name = self.ensure_unique_name(base_name, taken)
             try:
                 self.create_project(project_name, files, summary=summary)
             except FileExistsError:
-                counter += 1
-                project_name = f"{base_name}-{counter}"
+                # claimed by a concurrent request after the directory was listed
+                taken.add(project_name)
             else:
                 self.update_manifest(project_name, prompt=prompt, stack="scaffold")
                 break
@@ -180,6 +397,13 @@ class ProjectManager:
         if not project_dir.exists():
             raise FileNotFoundError(f"Project '{name}' not found.")
         shutil.rmtree(project_dir)
+        self._tree_cache_path(name).unlink(missing_ok=True)
+        with self._manifest_lock:
+            self._manifest_cache.pop(name, None)
+            self._dirty.pop(name, None)
+            self._last_flush.pop(name, None)
+        self._invalidate(name)
+        self._forget_files(name)
 
     def get_project_files(self, name: str) -> Dict[str, str]:
         """Return all file contents for a given project."""
@@ -187,58 +411,135 @@ class ProjectManager:
         if not project_dir.exists():
             raise FileNotFoundError(f"Project '{name}' not found.")
 
-        files: Dict[str, str] = {}
-        for path in project_dir.rglob("*"):
-            if path.is_file():
-                files[str(path.relative_to(project_dir))] = path.read_text(encoding="utf-8", errors="ignore")
-        return files
+        entries = list(_walk_files(project_dir))
+        paths = [path for path, _relative in entries]
+        if len(paths) < PARALLEL_IO_THRESHOLD:
+            contents = [_read_text(path) for path in paths]
+        else:
+            # reads release the GIL, so larger projects overlap their IO
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+                contents = list(pool.map(_read_text, paths))
+        return {relative: content for (_path, relative), content in zip(entries, contents)}
 
     def list_project_files(self, name: str) -> List[str]:
         """Return a list of files within the specified project."""
         project_dir = self._project_path(name)
-        if not project_dir.exists():
-            raise FileNotFoundError(f"Project '{name}' not found.")
-        return [str(path.relative_to(project_dir)) for path in project_dir.rglob("*") if path.is_file()]
+        try:
+            mtime = project_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Project '{name}' not found.") from None
+        cached = self._files_cache.get(name)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+        files = [relative for _path, relative in _walk_files(project_dir)]
+        self._files_cache[name] = (mtime, files)
+        return list(files)
 
     def read_file(self, name: str, relative_path: str) -> str:
         """Return the content of a single file within a project."""
         project_dir = self._project_path(name)
         file_path = project_dir / relative_path
-        if not file_path.exists():
-            raise FileNotFoundError(f"File '{relative_path}' not found in project '{name}'.")
-        return file_path.read_text(encoding="utf-8", errors="ignore")
-
-    def save_file(self, name: str, relative_path: str, content: str) -> Path:
-        """Persist new content to a file within the project."""
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File '{relative_path}' not found in project '{name}'.") from None
+
+        key = (name, relative_path)
+        with self._file_cache_lock:
+            cached = self._file_cache.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._file_cache.move_to_end(key)
+                return cached[2]
+
+        content = file_path.read_text(encoding="utf-8", errors="ignore")
+        with self._file_cache_lock:
+            self._file_cache[key] = (stat.st_mtime_ns, stat.st_size, content)
+            self._file_cache.move_to_end(key)
+            if len(self._file_cache) > FILE_CACHE_SIZE:
+                self._file_cache.popitem(last=False)
+        return content
+
+    def save_file(self, name: str, relative_path: str, content: str, *, touch_manifest: bool = True) -> Path:
+        """Persist new content to a file within the project.
+
+        Callers writing several files at once can pass ``touch_manifest=False``
+        and call ``update_manifest`` once afterwards.
+        """
         project_dir = self._project_path(name)
         if not project_dir.exists():
             raise FileNotFoundError(f"Project '{name}' not found.")
         file_path = project_dir / relative_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        created = not file_path.exists()
+        if "/" in relative_path:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(content, encoding="utf-8")
-        self.update_manifest(name)
+        with self._file_cache_lock:
+            self._file_cache.pop((name, relative_path), None)
+        if created:
+            # nested files leave the project root untouched; bump it so the tree cache sees the change
+            os.utime(project_dir)
+            self._invalidate(name)
+        if touch_manifest:
+            self.update_manifest(name)
         return file_path
 
-    def zip_project(self, name: str) -> Tuple[io.BytesIO, str]:
-        """Return an in-memory zip archive for the given project."""
+    def zip_project(self, name: str) -> Tuple[Iterable[bytes], str]:
+        """Return a zip archive for the given project as an iterable of bytes.
+
+        The archive is generated lazily while it is being sent, by
+        ``zipstream-ng`` when installed and by ``_iter_zip`` otherwise.
+        """
         project_dir = self._project_path(name)
         if not project_dir.exists():
             raise FileNotFoundError(f"Project '{name}' not found.")
 
-        memory_file = io.BytesIO()
-        with zipfile.ZipFile(memory_file, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for path in project_dir.rglob("*"):
-                if path.is_file():
-                    zf.write(path, arcname=str(path.relative_to(project_dir)))
-        memory_file.seek(0)
-        return memory_file, f"{name}.zip"
+        if ZipStream is not None:
+            archive = ZipStream(compress_type=zipfile.ZIP_DEFLATED, compress_level=ZIP_COMPRESSLEVEL)
+            for path, relative in _walk_files(project_dir):
+                archive.add_path(path, arcname=relative, compress_type=_zip_compress_type(relative))
+            return archive, f"{name}.zip"
+
+        return self._iter_zip(project_dir), f"{name}.zip"
+
+    @staticmethod
+    def _iter_zip(project_dir: Path) -> Iterator[bytes]:
+        """Yield a zip archive of ``project_dir`` in chunks of roughly ``ZIP_CHUNK_SIZE`` bytes."""
+        buffer = _ChunkBuffer()
+        # the buffer cannot seek, so zipfile writes data descriptors after each member
+        with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
+            for path, relative in _walk_files(project_dir):
+                zf.write(path, arcname=relative, compress_type=_zip_compress_type(relative))
+                if buffer.size >= ZIP_CHUNK_SIZE:
+                    yield buffer.drain()
+        yield buffer.drain()
 
     def describe_project_tree(self, name: str) -> Dict[str, Dict[str, str]]:
         """Return a mapping of directories to contained files for UI consumption."""
+        return orjson.loads(self.describe_project_tree_json(name))
+
+    def describe_project_tree_json(self, name: str) -> str:
+        """Return the project tree already serialised as JSON.
+
+        The JSON is cached in a sidecar whose mtime is stamped with the
+        project directory's mtime, so a single ``stat`` pair validates it.
+        """
         project_dir = self._project_path(name)
-        if not project_dir.exists():
-            raise FileNotFoundError(f"Project '{name}' not found.")
-        return collect_directory_tree(project_dir)
+        try:
+            mtime = project_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Project '{name}' not found.") from None
+
+        cache_path = self._tree_cache_path(name)
+        try:
+            if cache_path.stat().st_mtime_ns == mtime:
+                return cache_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+
+        payload = orjson.dumps(collect_directory_tree(project_dir))
+        cache_path.write_bytes(payload)
+        os.utime(cache_path, ns=(mtime, mtime))
+        return payload.decode()
 
     def preview_html(self, name: str) -> str:
         """Return HTML suitable for inline preview of a project."""
@@ -265,146 +566,21 @@ class ProjectManager:
     def _render_scaffold(self, prompt: str) -> Dict[str, str]:
         """Return a structured project scaffold derived from the prompt."""
 
-        title = prompt.strip().title() or "AI WebForge Project"
-        slug = slugify(title)
-        css_content = textwrap.dedent(
-            f"""
-            :root {{
-                color-scheme: dark;
-                font-family: 'Inter', system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            }}
-
-            body {{
-                margin: 0;
-                padding: 0;
-                min-height: 100vh;
-                background: radial-gradient(circle at top, #111927 0%, #05070a 100%);
-                color: #f8fafc;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-            }}
-
-            .container {{
-                width: min(960px, 90vw);
-                padding: 3rem;
-                background: rgba(15, 23, 42, 0.85);
-                border-radius: 24px;
-                border: 1px solid rgba(148, 163, 184, 0.12);
-                box-shadow: 0 24px 60px -32px rgba(0, 0, 0, 0.75);
-            }}
-
-            .accent {{
-                color: #00e19a;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 0.18em;
-            }}
-
-            button {{
-                background: linear-gradient(120deg, #00e19a 0%, #11f0aa 100%);
-                border: none;
-                color: #03110d;
-                padding: 0.85rem 1.6rem;
-                font-weight: 600;
-                border-radius: 999px;
-                cursor: pointer;
-                transition: transform 150ms ease, box-shadow 150ms ease;
-            }}
-
-            button:hover {{
-                transform: translateY(-1px);
-                box-shadow: 0 12px 20px -12px rgba(0, 225, 154, 0.55);
-            }}
-            """
-        ).strip()
-
-        html_content = textwrap.dedent(
-            f"""
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="utf-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1">
-                <title>{title}</title>
-                <link rel="stylesheet" href="./static/style.css">
-            </head>
-            <body>
-                <main class="container">
-                    <p class="accent">{slug}</p>
-                    <h1>{title}</h1>
-                    <p>{prompt.strip() or 'A locally generated scaffold created by AI-WebForge.'}</p>
-                    <button id="cta">Launch Experience</button>
-                </main>
-                <script src="./static/script.js" defer></script>
-            </body>
-            </html>
-            """
-        ).strip()
-
-        js_content = textwrap.dedent(
-            """
-            document.addEventListener('DOMContentLoaded', () => {
-                const button = document.querySelector('#cta');
-                if (!button) return;
-                button.addEventListener('click', () => {
-                    button.textContent = 'Experience in progress…';
-                    button.disabled = true;
-                    setTimeout(() => {
-                        button.textContent = 'Ready to Launch';
-                        button.disabled = false;
-                    }, 1200);
-                });
-            });
-            """
-        ).strip()
-
-        api_content = textwrap.dedent(
-            """
-            '''Minimal FastAPI application for the generated project.'''
-            from fastapi import FastAPI
-            from fastapi.responses import HTMLResponse
-            from pathlib import Path
-
-
-            app = FastAPI(title="Generated App")
-
-
-            @app.get("/", response_class=HTMLResponse)
-            async def index() -> HTMLResponse:
-                html_path = Path(__file__).resolve().parent.parent / "public" / "index.html"
-                return HTMLResponse(html_path.read_text(encoding="utf-8"))
-            """
-        ).strip()
-
-        readme_content = textwrap.dedent(
-            f"""
-            # {title}
-
-            Generated locally by **AI-WebForge** on {datetime.utcnow():%Y-%m-%d %H:%M UTC}.
-
-            ## Overview
-
-            - Prompt: `{prompt.strip()}`
-            - Framework: FastAPI + static frontend assets
-            - Theme: Dark interface with neon green highlights
-
-            ## Getting Started
-
-            ```bash
-            uvicorn app.main:app --reload
-            ```
-
-            Then open http://127.0.0.1:8000 to explore the generated experience.
-            """
-        ).strip()
-
+        stripped = prompt.strip()
+        title = stripped.title() or "AI WebForge Project"
+        context = {
+            "title": title,
+            "slug": slugify(title),
+            "prompt": stripped,
+            "description": stripped or "A locally generated scaffold created by AI-WebForge.",
+            "generated_at": f"{datetime.now(timezone.utc):%Y-%m-%d %H:%M UTC}",
+        }
         return {
-            "public/index.html": html_content,
-            "public/static/style.css": css_content,
-            "public/static/script.js": js_content,
-            "app/main.py": api_content,
-            "README.md": readme_content,
+            "public/index.html": SCAFFOLD_HTML.format_map(context),
+            "public/static/style.css": SCAFFOLD_CSS,
+            "public/static/script.js": SCAFFOLD_JS,
+            "app/main.py": SCAFFOLD_API,
+            "README.md": SCAFFOLD_README.format_map(context),
         }
 
 
@@ -1,12 +1,15 @@
 """Utility helpers for AI-WebForge."""
 from __future__ import annotations
 
-import json
+import functools
 import os
 import re
+import string
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
@@ -15,33 +18,81 @@ MODELS_DIR = DATA_DIR / "models"
 CONFIG_PATH = DATA_DIR / "config.json"
 
 _DEFAULT_CONFIG: Dict[str, Any] = {"active_model": None}
+_DIRS_READY = False
+# (st_mtime_ns, st_size, parsed config) of the last read or write of CONFIG_PATH
+_config_cache: Optional[Tuple[int, int, Dict[str, Any]]] = None
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a temporary file and ``os.replace``.
+
+    Readers see either the old or the new content, never a partial write.
+    """
+
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _dump_config(config: Dict[str, Any]) -> None:
+    global _config_cache
+    atomic_write_bytes(CONFIG_PATH, orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    stat = CONFIG_PATH.stat()
+    _config_cache = (stat.st_mtime_ns, stat.st_size, dict(config))
 
 
 def ensure_directories() -> None:
-    """Ensure that the data directories and configuration file exist."""
+    """Ensure that the data directories and configuration file exist.
+
+    Only the first call touches the filesystem; the directories are assumed to
+    stay in place for the lifetime of the process.
+    """
 
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
     PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
     MODELS_DIR.mkdir(parents=True, exist_ok=True)
     if not CONFIG_PATH.exists():
-        CONFIG_PATH.write_text(json.dumps(_DEFAULT_CONFIG, indent=2), encoding="utf-8")
+        _dump_config(_DEFAULT_CONFIG)
+    _DIRS_READY = True
 
 
 def load_config() -> Dict[str, Any]:
-    """Return the persisted configuration dictionary."""
+    """Return the persisted configuration dictionary.
 
-    ensure_directories()
+    The parsed file is cached until its mtime or size changes, so repeated
+    lookups cost a single ``stat``.
+    """
+
+    global _config_cache
+    try:
+        stat = CONFIG_PATH.stat()
+    except FileNotFoundError:
+        ensure_directories()
+        try:
+            stat = CONFIG_PATH.stat()
+        except FileNotFoundError:
+            # removed while running; recreate it like a fresh install would
+            _dump_config(_DEFAULT_CONFIG)
+            return dict(_DEFAULT_CONFIG)
+    cached = _config_cache
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return dict(cached[2])
     try:
-        return json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        CONFIG_PATH.write_text(json.dumps(_DEFAULT_CONFIG, indent=2), encoding="utf-8")
+        config = orjson.loads(CONFIG_PATH.read_bytes())
+    except orjson.JSONDecodeError:
+        _dump_config(_DEFAULT_CONFIG)
         return dict(_DEFAULT_CONFIG)
+    _config_cache = (stat.st_mtime_ns, stat.st_size, config)
+    return dict(config)
 
 
 def save_config(config: Dict[str, Any]) -> None:
     """Persist the provided configuration dictionary."""
 
     ensure_directories()
-    CONFIG_PATH.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    _dump_config(config)
 
 
 def get_active_model() -> Optional[str]:
@@ -58,33 +109,62 @@ def set_active_model(name: Optional[str]) -> None:
     save_config(config)
 
 
+_SLUG_KEEP = frozenset(string.ascii_lowercase + string.digits + "-")
+
+
+class _SlugTable(dict):
+    """``str.translate`` table keeping ``[a-z0-9]``, turning whitespace into ``-`` and dropping the rest."""
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        # only ASCII is stored up front; anything else is classified on the fly and
+        # not remembered, so arbitrary user input cannot grow the table
+        return "-" if chr(codepoint).isspace() else None
+
+
+_SLUG_TABLE = _SlugTable(
+    {ord(char): char if char in _SLUG_KEEP else ("-" if char.isspace() else None) for char in map(chr, range(128))}
+)
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+
+@functools.lru_cache(maxsize=512)
 def slugify(value: str) -> str:
-    """Return a filesystem-friendly slug for the provided value."""
+    """Return a filesystem-friendly slug for the provided value.
+
+    Results are memoised; the function is pure and strings are immutable, so
+    sharing cached slugs between callers is safe.
+    """
+
+    value = value.strip().lower().translate(_SLUG_TABLE)
+    return _DASH_RUN_RE.sub("-", value) or "project"
+
 
-    value = value.strip().lower()
-    value = re.sub(r"[^a-z0-9\-\s]+", "", value)
-    value = re.sub(r"[\s\-]+", "-", value)
-    return value or "project"
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def human_readable_size(num_bytes: int) -> str:
     """Convert a byte value into a human-readable string."""
 
-    step = 1024.0
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if num_bytes < step:
-            return f"{num_bytes:3.1f} {unit}"
-        num_bytes /= step
-    return f"{num_bytes:.1f} PB"
+    if num_bytes < 1024:
+        return f"{num_bytes:.1f} B"
+    # every 10 bits is one 1024x unit step
+    index = min((int(num_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{num_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
 
 
 def collect_directory_tree(root: Path) -> Dict[str, Dict[str, str]]:
     """Return a representation of a project's directory tree."""
 
+    root_s = str(root)
+    # dirpath always starts with root_s, so the relative part is a plain slice
+    prefix_len = len(root_s) + 1
     tree: Dict[str, Dict[str, str]] = {}
-    for dirpath, _dirnames, filenames in os.walk(root):
-        relative_dir = Path(dirpath).relative_to(root)
-        tree[str(relative_dir)] = {name: str(Path(dirpath, name).relative_to(root)) for name in filenames}
+    for dirpath, _dirnames, filenames in os.walk(root_s):
+        if len(dirpath) > prefix_len:
+            relative_dir = dirpath[prefix_len:].replace(os.sep, "/")
+            tree[relative_dir] = {name: relative_dir + "/" + name for name in filenames}
+        else:
+            tree["."] = {name: name for name in filenames}
     return tree
 
 
@@ -1,32 +1,70 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Iterator, Optional
-
-from llama_cpp import Llama
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Type
 
 from core.config import get_selected_model
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from llama_cpp import Llama
+
 
 class LLMService:
-    _llm: Optional[Llama] = None
-    _path: Optional[str] = None
+    # recently used models stay resident so switching back and forth does not reload weights
+    _MAX = 2
+    # llama_cpp loads its shared library on import, so it is only imported when a model is needed
+    _Llama: Optional[Type["Llama"]] = None
+    _cache: "OrderedDict[str, Llama]" = OrderedDict()
+    # (resolved path, instance) kept in one attribute so the lock-free read sees a matching pair
+    _current: Optional[Tuple[str, "Llama"]] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _llama_class(cls) -> Type["Llama"]:
+        if cls._Llama is None:
+            try:
+                from llama_cpp import Llama
+            except ImportError as exc:
+                raise RuntimeError("llama_cpp is not installed. Run `pip install llama-cpp-python`.") from exc
+            cls._Llama = Llama
+        return cls._Llama
 
     @classmethod
-    def ensure_loaded(cls) -> None:
+    def ensure_loaded(cls) -> "Llama":
         path = get_selected_model()
         if not path:
             raise RuntimeError("No model selected. Use /api/models/select.")
         path = str(Path(path).resolve())
-        if cls._llm and cls._path == path:
-            return
-        cls._llm = Llama(model_path=path, n_ctx=4096, verbose=False)
-        cls._path = path
+        current = cls._current
+        if current is not None and current[0] == path:
+            return current[1]
+        with cls._lock:
+            llm = cls._cache.get(path)
+            if llm is not None:
+                cls._cache.move_to_end(path)
+            else:
+                llm = cls._llama_class()(model_path=path, n_ctx=4096, verbose=False)
+                cls._cache[path] = llm
+                if len(cls._cache) > cls._MAX:
+                    # dropping the last reference lets llama_cpp free the model
+                    cls._cache.popitem(last=False)
+            cls._current = (path, llm)
+            return llm
+
+    @classmethod
+    def evict_all(cls) -> None:
+        """Drop every cached model; the selected one is reloaded on next use."""
+
+        with cls._lock:
+            cls._cache.clear()
+            cls._current = None
 
     @classmethod
     def chat(cls, prompt: str) -> str:
-        cls.ensure_loaded()
-        res = cls._llm.create_chat_completion(
+        llm = cls.ensure_loaded()
+        res = llm.create_chat_completion(
             messages=[{"role": "user", "content": prompt}],
             stream=False,
             temperature=0.6,
@@ -34,18 +72,18 @@ class LLMService:
         )
         try:
             return res["choices"][0]["message"]["content"]
-        except Exception:
+        except (KeyError, IndexError, TypeError):
             return str(res)
 
     @classmethod
     def stream(cls, prompt: str) -> Iterator[str]:
-        cls.ensure_loaded()
-        for chunk in cls._llm.create_chat_completion(
+        create = cls.ensure_loaded().create_chat_completion
+        for chunk in create(
             messages=[{"role": "user", "content": prompt}],
             stream=True,
             temperature=0.6,
             max_tokens=512,
         ):
-            delta = chunk["choices"][0]["delta"]
-            if "content" in delta and delta["content"]:
-                yield delta["content"]
+            content = chunk["choices"][0]["delta"].get("content")
+            if content:
+                yield content
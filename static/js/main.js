@@ -190,6 +190,17 @@ async function saveActiveFile() {
     }
 }
 
+async function loadBootstrap() {
+    try {
+        const payload = await fetchJSON('/api/bootstrap');
+        if (Array.isArray(payload.projects)) {
+            renderHomeProjects(payload.projects);
+        }
+    } catch (error) {
+        console.error(error);
+    }
+}
+
 async function refreshProjects() {
     try {
         const payload = await fetchJSON('/api/projects');
@@ -319,7 +330,11 @@ function connectToSession(sessionId) {
     ws.onmessage = (event) => {
         try {
             const payload = JSON.parse(event.data);
-            handleBuildEvent(payload);
+            if (payload.type === 'batch' || payload.type === 'history') {
+                payload.events.forEach(handleBuildEvent);
+            } else {
+                handleBuildEvent(payload);
+            }
         } catch (error) {
             console.error('Failed to parse build event', error);
         }
@@ -349,10 +364,7 @@ function initHome() {
     const input = qs('#chat-input');
     const clearButton = qs('#clear-console');
     const saveButton = qs('#save-active-file');
-    const context = window.WEBFORGE_CONTEXT || {};
-    if (Array.isArray(context.projects)) {
-        renderHomeProjects(context.projects);
-    }
+    loadBootstrap();
     if (form && input) {
         form.addEventListener('submit', (event) => {
             event.preventDefault();